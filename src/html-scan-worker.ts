@@ -0,0 +1,11 @@
+// Worker thread entry: scans its slice of the HTML templates and posts the results back in order
+import { parentPort, workerData } from 'worker_threads';
+import { scanHtmlFiles } from './html-scanner';
+
+interface ScanWorkerData {
+  filepaths: string[];
+  pipeName: string;
+}
+
+const { filepaths, pipeName } = workerData as ScanWorkerData;
+scanHtmlFiles(filepaths, pipeName).then((results) => parentPort!.postMessage(results));
@@ -0,0 +1,243 @@
+// HTML template scanning, shared by the CLI and the scan worker threads
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { Worker } from 'worker_threads';
+
+// Helper to strip quotes from a key
+// Removes leading and trailing single or double quotes from a string
+function stripQuotes(key: string): string {
+  return key.replace(/^['"]|['"]$/g, '');
+}
+
+// Generalized function to ignore Angular control flow and template syntax
+function isTemplateControlFlow(text: string): boolean {
+  const trimmed = text.trim();
+  // Ignore lines that start with @ and end with {
+  if (/^@.*\{$/.test(trimmed)) return true;
+  // Ignore lines that are just }
+  if (trimmed === '}') return true;
+  // Ignore lines that start with } and then @...{
+  if (/^}\s*@.*\{$/.test(trimmed)) return true;
+  // Ignore lines that are just symbols, whitespace, or braces
+  if (/^[\s{}()=><!&|?:;.,'"\[\]-]*$/.test(trimmed)) return true;
+  return false;
+}
+
+// True if line[start, end) contains anything other than ASCII whitespace (all of which trim() removes)
+function hasNonWhitespace(line: string, start: number, end: number): boolean {
+  for (let i = start; i < end; i++) {
+    const code = line.charCodeAt(i);
+    // space, \t, \n, \v, \f, \r
+    if (code !== 32 && (code < 9 || code > 13)) return true;
+  }
+  return false;
+}
+
+export interface KeyOccurrence {
+  key: string;
+  line: number;
+}
+
+export interface HtmlScanResult {
+  staticTextOccurrences: KeyOccurrence[];
+  translocoKeyOccurrences: KeyOccurrence[];
+}
+
+// Extract static text and translation pipe keys (with their line numbers) from an HTML template
+export function scanHtmlContent(content: string, pipeRegex: RegExp): HtmlScanResult {
+  // Remove HTML comments but preserve line count by replacing with newlines
+  // This ensures line numbers in the report match the original file
+  const stripped = content.replace(/<!--[\s\S]*?-->/g, (match) => {
+    return match.replace(/[^\n]/g, '');
+  });
+  // Split file into lines for line-by-line processing
+  const lines = stripped.split(/\r?\n/);
+  // Arrays to store found static text and transloco keys with their line numbers
+  const staticTextOccurrences: KeyOccurrence[] = [];
+  const translocoKeyOccurrences: KeyOccurrence[] = [];
+
+  // --- Robust static text and translation key extraction between tags ---
+  let insideTag = false;
+  let buffer = '';
+  let bufferStartLine = 0;
+  // Whitespace-only runs between tags (indentation, line breaks) are never copied into the buffer
+  let bufferHasText = false;
+  const appendText = (line: string, start: number, end: number) => {
+    if (!bufferHasText) bufferHasText = hasNonWhitespace(line, start, end);
+    if (bufferHasText) buffer += line.slice(start, end);
+  };
+  lines.forEach((line, idx) => {
+    // Jump between tag boundaries with indexOf and copy text runs with slice,
+    // rather than walking the line one character at a time
+    let i = 0;
+    while (i < line.length) {
+      if (!insideTag) {
+        const tagEnd = line.indexOf('>', i);
+        if (tagEnd === -1) break;
+        insideTag = true;
+        buffer = '';
+        bufferHasText = false;
+        bufferStartLine = idx;
+        i = tagEnd + 1;
+        continue;
+      }
+      const tagStart = line.indexOf('<', i);
+      if (tagStart === -1) {
+        appendText(line, i, line.length);
+        break;
+      }
+      appendText(line, i, tagStart);
+      // Process buffer
+      const content = bufferHasText ? buffer.trim() : '';
+      // Only process if content contains at least one alphanumeric character and does not look like an attribute fragment
+      if (
+        content &&
+        /[a-zA-Z0-9]/.test(content) && // must contain at least one letter or number
+        !/^=/.test(content) && // does not start with '='
+        !/>$/.test(content) && // does not end with '>'
+        !/^([=><!{}\[\]"'\s:.()-]|d-none)+$/.test(content) // not just symbols/attribute syntax
+      ) {
+        // Both the pipe and interpolation patterns need '{{', so plain text skips both regexes
+        const hasInterpolation = content.includes('{{');
+        // Check for translation pipe (dynamic pipe name)
+        const pipeMatch = hasInterpolation ? pipeRegex.exec(content) : null;
+        if (pipeMatch) {
+          // Extract key and record as translation pipe key
+          const key = pipeMatch[1].trim();
+          translocoKeyOccurrences.push({ key, line: bufferStartLine + 1 });
+        } else if (hasInterpolation && /{{.*}}/.test(content)) {
+          // Ignore variable-only interpolation
+        } else {
+          // Treat as static text
+          let key = content;
+          key = stripQuotes(key);
+          if (
+            key &&
+            !isNumericOnly(key) &&
+            !isIgnorableHtmlEntity(key) &&
+            !isTemplateControlFlow(key) // <-- Use the new function
+          ) {
+            staticTextOccurrences.push({ key, line: bufferStartLine + 1 });
+          }
+        }
+      }
+      buffer = '';
+      bufferHasText = false;
+      insideTag = false;
+      i = tagStart + 1;
+    }
+  });
+  return { staticTextOccurrences, translocoKeyOccurrences };
+}
+
+// Read a whole file using one stat and a single sized read, instead of readFile's chunked read-until-EOF loop
+async function readFileBuffer(filepath: string): Promise<Buffer> {
+  const handle = await fs.promises.open(filepath, 'r');
+  try {
+    const { size } = await handle.stat();
+    const buffer = Buffer.allocUnsafe(size);
+    let offset = 0;
+    // A single read normally returns everything; loop only to cover short reads
+    while (offset < size) {
+      const { bytesRead } = await handle.read(buffer, offset, size - offset, offset);
+      if (bytesRead === 0) break;
+      offset += bytesRead;
+    }
+    return buffer.subarray(0, offset);
+  } finally {
+    await handle.close();
+  }
+}
+
+// Maximum number of HTML files read from disk at the same time
+export const HTML_READ_CONCURRENCY = Math.min(32, os.availableParallelism() * 4);
+
+// Run an async function over items with at most `limit` calls in flight, keeping results in input order
+export async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+  async function worker(): Promise<void> {
+    while (next < items.length) {
+      const idx = next++;
+      results[idx] = await fn(items[idx]);
+    }
+  }
+  // Always start at least one worker so every item is processed even if the limit is miscomputed
+  const workerCount = Math.min(Math.max(1, limit), items.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+}
+
+// Matches {{ 'key' | pipeName }}; build once per group since the pipe name is fixed
+export function buildPipeRegex(pipeName: string): RegExp {
+  return new RegExp(`{{\\s*['"]([^'"]+)['"]\\s*\\|\\s*${pipeName}\\s*}}`, 's');
+}
+
+// Read and scan one template; returns null if the file cannot be read or has nothing to scan
+export async function scanHtmlFile(filepath: string, pipeRegex: RegExp): Promise<HtmlScanResult | null> {
+  let raw: Buffer;
+  try {
+    raw = await readFileBuffer(filepath);
+  } catch (e) {
+    console.error(`Skipping file due to encoding error: ${filepath}`);
+    return null;
+  }
+  // Text is only collected after a '>', so templates without one skip decoding and scanning entirely
+  if (raw.indexOf('>') === -1) return null;
+  return scanHtmlContent(raw.toString('utf-8'), pipeRegex);
+}
+
+// Scan a list of templates with bounded concurrent reads, keeping results in input order
+export function scanHtmlFiles(filepaths: string[], pipeName: string): Promise<(HtmlScanResult | null)[]> {
+  const pipeRegex = buildPipeRegex(pipeName);
+  return mapWithConcurrency(filepaths, HTML_READ_CONCURRENCY, (filepath) => scanHtmlFile(filepath, pipeRegex));
+}
+
+// Minimum number of templates per worker thread; below this, thread startup costs more than it saves
+const FILES_PER_WORKER = 250;
+
+// Scan templates across worker threads when there are enough of them to keep several cores busy
+// Each worker gets a contiguous slice, so the concatenated results keep the input order
+export async function scanHtmlFilesParallel(filepaths: string[], pipeName: string): Promise<(HtmlScanResult | null)[]> {
+  const workerCount = Math.min(os.availableParallelism(), Math.floor(filepaths.length / FILES_PER_WORKER));
+  if (workerCount < 2) {
+    return scanHtmlFiles(filepaths, pipeName);
+  }
+  const chunkSize = Math.ceil(filepaths.length / workerCount);
+  const chunks: string[][] = [];
+  for (let start = 0; start < filepaths.length; start += chunkSize) {
+    chunks.push(filepaths.slice(start, start + chunkSize));
+  }
+  const results = await Promise.all(chunks.map((chunk) => new Promise<(HtmlScanResult | null)[]>((resolve, reject) => {
+    const worker = new Worker(path.join(__dirname, 'html-scan-worker.js'), { workerData: { filepaths: chunk, pipeName } });
+    worker.once('message', resolve);
+    worker.once('error', reject);
+    worker.once('exit', (code) => {
+      if (code !== 0) reject(new Error(`HTML scan worker stopped with exit code ${code}`));
+    });
+  })));
+  return results.flat();
+}
+
+// Improved isNumericOnly
+// Returns true if the text is a number, math/logic expression, or JS-like expression
+// Used to filter out numbers and expressions from translation key checks
+function isNumericOnly(text: string): boolean {
+  const trimmed = text.replace(/\s+/g, '');
+  // Pure number (e.g., '123')
+  if (/^\d+$/.test(trimmed)) return true;
+  // Pure expression (e.g., '1+2', '3*4', '5>2')
+  if (/^[\d+\-*/().><=!&|?:]+$/.test(trimmed)) return true;
+  // Ternary or logical expressions (e.g., '1>0?4:5')
+  if (/^\d+[\s><=!&|?:+\-*/().]*\d+$/.test(trimmed)) return true;
+  // JS expression: contains only numbers, operators, spaces, and curly braces
+  if (/^[\d\s+\-*/().><=!&|?:{}]+$/.test(text)) return true;
+  return false;
+}
+
+// Helper function to check if text is an ignorable HTML entity
+function isIgnorableHtmlEntity(text: string): boolean {
+  // Ignore &nbsp;, &nbsp, and any other HTML entity if needed
+  return /^&nbsp;?$/i.test(text.trim());
+}
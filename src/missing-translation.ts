@@ -3,6 +3,7 @@ import * as fs from 'fs';
 import * as path from 'path';
 import { Command } from 'commander';
 import { exec, execSync } from 'child_process';
+import { scanHtmlFilesParallel } from './html-scanner';
 
 interface Result {
   missingKeysEn: Record<string, string[]>;
@@ -34,46 +35,79 @@ function flattenObject(obj: any, prefix = '', objectKeys = new Set<string>()): {
   return { flat: result, objectKeys };
 }
 
+interface TranslationFile {
+  keys: Set<string>;
+  objectKeys: Set<string>;
+  topLevelObjects: Set<string>;
+}
+
+// Parsed translation files keyed by absolute path; groups that share translation files
+// (e.g. a root group and its feature groups) only parse each file once per modification
+const translationFileCache = new Map<string, { mtimeMs: number, size: number, parsed: TranslationFile }>();
+
+// Load a translation file, reusing the parsed result while the file's mtime and size are unchanged
+// Shared by en.json and the other translation files so each file is read and parsed in one place
+function loadTranslationFile(file: string): TranslationFile {
+  const resolved = path.resolve(file);
+  const { mtimeMs, size } = fs.statSync(resolved);
+  const cached = translationFileCache.get(resolved);
+  if (cached && cached.mtimeMs === mtimeMs && cached.size === size) {
+    return cached.parsed;
+  }
+  const parsed = parseTranslationFile(resolved);
+  translationFileCache.set(resolved, { mtimeMs, size, parsed });
+  return parsed;
+}
+
+// Parse a translation JSON file into its flattened leaf keys, nested object keys and top-level objects
+function parseTranslationFile(file: string): TranslationFile {
+  const raw = JSON.parse(fs.readFileSync(file, 'utf-8'));
+  const topLevelObjects = new Set<string>();
+  for (const key in raw) {
+    if (typeof raw[key] === 'object' && raw[key] !== null && !Array.isArray(raw[key])) {
+      topLevelObjects.add(key);
+    }
+  }
+  const { flat, objectKeys } = flattenObject(raw);
+  return { keys: new Set(Object.keys(flat)), objectKeys, topLevelObjects };
+}
+
 // Move walk function to top-level so it can be used in findMissingTranslations
-function walk(dir: string, callback: (filePath: string) => void, excludeDirs: string[] = []) {
+// fileFilter is applied to the entry name before any path is built, so unrelated files cost nothing
+function walk(
+  dir: string,
+  callback: (filePath: string) => void,
+  excludeDirs: string[] = [],
+  fileFilter?: (fileName: string) => boolean
+) {
   for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
-    const fullPath = path.join(dir, entry.name);
-    // If this directory is in the exclude list, skip it
-    if (entry.isDirectory() && excludeDirs.includes(path.resolve(fullPath))) {
-      continue;
-    }
     if (entry.isDirectory()) {
-      walk(fullPath, callback, excludeDirs);
-    } else if (entry.isFile()) {
-      callback(fullPath);
+      const fullPath = path.join(dir, entry.name);
+      // If this directory is in the exclude list, skip it
+      if (excludeDirs.length > 0 && excludeDirs.includes(path.resolve(fullPath))) {
+        continue;
+      }
+      walk(fullPath, callback, excludeDirs, fileFilter);
+    } else if (entry.isFile() && (!fileFilter || fileFilter(entry.name))) {
+      callback(path.join(dir, entry.name));
     }
   }
 }
 
-function findMissingTranslations(
+async function findMissingTranslations(
   rootDir: string,
   translationFiles: string[],
   enFile: string,
   keyPrefix?: string,
   pipeName: string = 'transloco',
   excludeDirs: string[] = []
-): Result {
+): Promise<Result> {
   // Part 1: Find missing keys compared to en.json (excluding object-like keys)
-  let enTranslations: Record<string, any> = {};
   let enKeys: Set<string> = new Set();
   let enTopLevelObjects: Set<string> = new Set();
   let enObjectKeys: Set<string> = new Set();
   try {
-    const enRaw = JSON.parse(fs.readFileSync(enFile, 'utf-8'));
-    for (const key in enRaw) {
-      if (typeof enRaw[key] === 'object' && enRaw[key] !== null && !Array.isArray(enRaw[key])) {
-        enTopLevelObjects.add(key);
-      }
-    }
-    const enResult = flattenObject(enRaw);
-    enTranslations = enResult.flat;
-    enKeys = new Set(Object.keys(enTranslations));
-    enObjectKeys = enResult.objectKeys;
+    ({ keys: enKeys, objectKeys: enObjectKeys, topLevelObjects: enTopLevelObjects } = loadTranslationFile(enFile));
   } catch (e) {
     console.error(`Error: English translation file not found or invalid: ${enFile}`);
     process.exit(1);
@@ -82,34 +116,34 @@ function findMissingTranslations(
   const missingKeysEn: Record<string, string[]> = {};
   const objectKeyMismatches: Record<string, string[]> = {};
   const missingTopLevelObjects: Record<string, string[]> = {};
+  // Keys of every successfully parsed translation file, reused by Part 2 so each file is read only once
+  const allTranslations: Record<string, Set<string>> = { [enFile]: enKeys };
   let totalMissingKeysEn = 0;
+  // Leaf keys of en.json, computed once rather than for every compared file
+  const enLeafKeys = Array.from(enKeys).filter((key) => !enObjectKeys.has(key));
 
   for (const file of translationFiles) {
     if (file !== enFile) {
-      let translations: Record<string, any> = {};
       let keys: Set<string> = new Set();
       let objectKeys: Set<string> = new Set();
       let topLevelObjects: Set<string> = new Set();
       try {
-        const raw = JSON.parse(fs.readFileSync(file, 'utf-8'));
-        for (const key in raw) {
-          if (typeof raw[key] === 'object' && raw[key] !== null && !Array.isArray(raw[key])) {
-            topLevelObjects.add(key);
-          }
-        }
-        const result = flattenObject(raw);
-        translations = result.flat;
-        keys = new Set(Object.keys(translations));
-        objectKeys = result.objectKeys;
+        ({ keys, objectKeys, topLevelObjects } = loadTranslationFile(file));
       } catch (e) {
         console.error(`Error: Translation file not found or invalid: ${file}`);
         continue;
       }
+      allTranslations[file] = keys;
       // Check for missing keys (only check leaf keys, not object keys)
-      const missing = Array.from(enKeys)
-        .filter((key) => !enObjectKeys.has(key)) // Only leaf keys
-        .filter((key) => !keys.has(key));
-      if (missing.length > 0) {
+      // The result array is only allocated on the first miss, so fully translated files cost no allocation
+      let missing: string[] | undefined;
+      for (const key of enLeafKeys) {
+        if (!keys.has(key)) {
+          if (!missing) missing = [];
+          missing.push(key);
+        }
+      }
+      if (missing) {
         missingKeysEn[file] = missing;
         totalMissingKeysEn += missing.length;
       }
@@ -144,160 +178,64 @@ function findMissingTranslations(
   // Part 2: Find missing static translations in HTML files
   const missingTranslationsHtml: Record<string, string[]> = {};
   const missingTranslocoKeys: Record<string, string[]> = {};
-  const allTranslations: Record<string, Set<string>> = { [enFile]: enKeys };
-  for (const file of translationFiles) {
-    if (file !== enFile) {
-      try {
-        const translations = JSON.parse(fs.readFileSync(file, 'utf-8'));
-        allTranslations[file] = new Set(Object.keys(translations));
-      } catch (e) {
-        continue;
-      }
-    }
-  }
+  // A key only needs to exist in one translation file. Rather than copying every file into a merged set,
+  // check the files in order: en.json comes first and is normally a superset, so most lookups stop there
+  const translationKeySets = Object.values(allTranslations);
+  const translatedKeys: KeyLookup = {
+    has: (key: string) => translationKeySets.some((keys) => keys.has(key)),
+  };
 
   let totalMissingStatic = 0;
   let totalMissingTransloco = 0;
 
-  // Helper to strip quotes from a key
-  // Removes leading and trailing single or double quotes from a string
-  function stripQuotes(key: string): string {
-    return key.replace(/^['"]|['"]$/g, '');
-  }
+  // Collect the HTML files first so they can be read and scanned concurrently
+  const htmlFiles: string[] = [];
+  walk(
+    rootDir,
+    (filepath: string) => htmlFiles.push(filepath),
+    excludeDirs,
+    (fileName: string) => fileName.endsWith('.html') && !fileName.endsWith('index.html')
+  );
+
+  // Large template sets are split across worker threads; small ones are scanned in-process
+  const scans = await scanHtmlFilesParallel(htmlFiles, pipeName);
+
+  // Group occurrences by key in walk order, so each distinct key is looked up only once
+  // and the report is the same regardless of read completion order
+  const staticTextLocations = new Map<string, string[]>();
+  const translocoKeyLocations = new Map<string, string[]>();
+  htmlFiles.forEach((filepath, fileIdx) => {
+    const scan = scans[fileIdx];
+    if (!scan) return;
+    for (const { key, line } of scan.staticTextOccurrences) {
+      pushToGroup(staticTextLocations, key, `${filepath}:${line}`);
+    }
+    for (const { key, line } of scan.translocoKeyOccurrences) {
+      pushToGroup(translocoKeyLocations, key, `${filepath}:${line}`);
+    }
+  });
 
-  // Generalized function to ignore Angular control flow and template syntax
-  function isTemplateControlFlow(text: string): boolean {
-    const trimmed = text.trim();
-    // Ignore lines that start with @ and end with {
-    if (/^@.*\{$/.test(trimmed)) return true;
-    // Ignore lines that are just }
-    if (trimmed === '}') return true;
-    // Ignore lines that start with } and then @...{
-    if (/^}\s*@.*\{$/.test(trimmed)) return true;
-    // Ignore lines that are just symbols, whitespace, or braces
-    if (/^[\s{}()=><!&|?:;.,'"\[\]-]*$/.test(trimmed)) return true;
-    return false;
+  // Check missing static text
+  for (const [key, locations] of staticTextLocations) {
+    if (!keyExists(key, translatedKeys, keyPrefix)) {
+      missingTranslationsHtml[key] = locations;
+      totalMissingStatic += locations.length;
+    }
   }
-
-  walk(rootDir, (filepath: string) => {
-    if (filepath.endsWith('.html') && !filepath.endsWith('index.html')) {
-      let content: string;
-      try {
-        content = fs.readFileSync(filepath, 'utf-8');
-      } catch (e) {
-        console.error(`Skipping file due to encoding error: ${filepath}`);
-        return;
-      }
-      // Remove HTML comments but preserve line count by replacing with newlines
-      // This ensures line numbers in the report match the original file
-      content = content.replace(/<!--[\s\S]*?-->/g, (match) => {
-        return match.replace(/[^\n]/g, '');
-      });
-      // Split file into lines for line-by-line processing
-      const lines = content.split(/\r?\n/);
-      // Arrays to store found static text and transloco keys with their line numbers
-      const staticTextOccurrences: { key: string, line: number }[] = [];
-      const translocoKeyOccurrences: { key: string, line: number }[] = [];
-
-      // --- Robust static text and translation key extraction between tags ---
-      let insideTag = false;
-      let buffer = '';
-      let bufferStartLine = 0;
-      lines.forEach((line, idx) => {
-        let i = 0;
-        while (i < line.length) {
-          if (!insideTag && line[i] === '>') {
-            insideTag = true;
-            buffer = '';
-            bufferStartLine = idx;
-            i++;
-            continue;
-          }
-          if (insideTag && line[i] === '<') {
-            // Process buffer
-            const content = buffer.trim();
-            // Only process if content contains at least one alphanumeric character and does not look like an attribute fragment
-            if (
-              content &&
-              /[a-zA-Z0-9]/.test(content) && // must contain at least one letter or number
-              !/^=/.test(content) && // does not start with '='
-              !/>$/.test(content) && // does not end with '>'
-              !/^([=><!{}\[\]"'\s:.()-]|d-none)+$/.test(content) // not just symbols/attribute syntax
-            ) {
-              // Check for translation pipe (dynamic pipe name)
-              const pipeRegex = new RegExp(`{{\\s*['"]([^'"]+)['"]\\s*\\|\\s*${pipeName}\\s*}}`, 's');
-              const pipeMatch = pipeRegex.exec(content);
-              if (pipeMatch) {
-                // Extract key and record as translation pipe key
-                const key = pipeMatch[1].trim();
-                translocoKeyOccurrences.push({ key, line: bufferStartLine + 1 });
-              } else if (/{{.*}}/.test(content)) {
-                // Ignore variable-only interpolation
-              } else {
-                // Treat as static text
-                let key = content;
-                key = stripQuotes(key);
-                if (
-                  key &&
-                  !isNumericOnly(key) &&
-                  !isIgnorableHtmlEntity(key) &&
-                  !isTemplateControlFlow(key) // <-- Use the new function
-                ) {
-                  staticTextOccurrences.push({ key, line: bufferStartLine + 1 });
-                }
-              }
-            }
-            buffer = '';
-            insideTag = false;
-            i++;
-            continue;
-          }
-          if (insideTag) {
-            buffer += line[i];
-          }
-          i++;
-        }
-      });
-
-      // Check missing static text
-      for (const { key, line } of staticTextOccurrences) {
-        let isTranslated = false;
-        for (const keys of Object.values(allTranslations)) {
-          if (keyExists(key, keys, keyPrefix)) {
-            isTranslated = true;
-            break;
-          }
-        }
-        if (!isTranslated) {
-          if (!missingTranslationsHtml[key]) missingTranslationsHtml[key] = [];
-          missingTranslationsHtml[key].push(`${filepath}:${line}`);
-          totalMissingStatic++;
-        }
-      }
-      // Check missing transloco keys
-      for (const { key, line } of translocoKeyOccurrences) {
-        let isTranslated = false;
-        let checkedKey = key;
-        // If a prefix is provided, ensure it ends with a dot for matching
-        let effectivePrefix = keyPrefix ? (keyPrefix.endsWith('.') ? keyPrefix : keyPrefix + '.') : undefined;
-        // If the key starts with the (dot-appended) prefix, remove it ONCE from the start
-        if (effectivePrefix && key.startsWith(effectivePrefix)) {
-          checkedKey = key.slice(effectivePrefix.length);
-        }
-        for (const keys of Object.values(allTranslations)) {
-          if (keys.has(checkedKey)) {
-            isTranslated = true;
-            break;
-          }
-        }
-        if (!isTranslated) {
-          if (!missingTranslocoKeys[key]) missingTranslocoKeys[key] = [];
-          missingTranslocoKeys[key].push(`${filepath}:${line}`);
-          totalMissingTransloco++;
-        }
-      }
+  // Check missing transloco keys
+  // If a prefix is provided, ensure it ends with a dot for matching
+  const effectivePrefix = keyPrefix ? (keyPrefix.endsWith('.') ? keyPrefix : keyPrefix + '.') : undefined;
+  for (const [key, locations] of translocoKeyLocations) {
+    let checkedKey = key;
+    // If the key starts with the (dot-appended) prefix, remove it ONCE from the start
+    if (effectivePrefix && key.startsWith(effectivePrefix)) {
+      checkedKey = key.slice(effectivePrefix.length);
     }
-  }, excludeDirs);
+    if (!translatedKeys.has(checkedKey)) {
+      missingTranslocoKeys[key] = locations;
+      totalMissingTransloco += locations.length;
+    }
+  }
 
   return {
     missingKeysEn,
@@ -443,7 +381,7 @@ function detectEditor(): string {
 const editorCli = detectEditor();
 
 // Main logic: process each group
-function main(): number {
+async function main(): Promise<number> {
   let overallExitCode = 0;
   let globalReportContent = '';
   let groupSummaries: string[] = [];
@@ -473,7 +411,7 @@ function main(): number {
       reportContent += `  - ${f}\n`;
     }
     try {
-      const result = findMissingTranslations(srcDir, files, i18nFile, keyPrefix, pipeName, excludeDirs);
+      const result = await findMissingTranslations(srcDir, files, i18nFile, keyPrefix, pipeName, excludeDirs);
       const {
         missingKeysEn,
         missingTranslationsHtml,
@@ -617,37 +555,29 @@ function main(): number {
     }
   }
 
-  // Print the same detailed report in the terminal
-  console.log('\n===== FULL REPORT =====\n');
-  console.log(finalReport);
+  // Print the same detailed report in the terminal with a single write
+  process.stdout.write(`\n===== FULL REPORT =====\n\n${finalReport}\n`);
 
   return overallExitCode;
 }
 
-// Improved isNumericOnly
-// Returns true if the text is a number, math/logic expression, or JS-like expression
-// Used to filter out numbers and expressions from translation key checks
-function isNumericOnly(text: string): boolean {
-  const trimmed = text.replace(/\s+/g, '');
-  // Pure number (e.g., '123')
-  if (/^\d+$/.test(trimmed)) return true;
-  // Pure expression (e.g., '1+2', '3*4', '5>2')
-  if (/^[\d+\-*/().><=!&|?:]+$/.test(trimmed)) return true;
-  // Ternary or logical expressions (e.g., '1>0?4:5')
-  if (/^\d+[\s><=!&|?:+\-*/().]*\d+$/.test(trimmed)) return true;
-  // JS expression: contains only numbers, operators, spaces, and curly braces
-  if (/^[\d\s+\-*/().><=!&|?:{}]+$/.test(text)) return true;
-  return false;
+// Append a value to the list stored under key, creating the list on first use (one map lookup on the hot path)
+function pushToGroup<K, V>(listsByKey: Map<K, V[]>, key: K, value: V): void {
+  const list = listsByKey.get(key);
+  if (list) {
+    list.push(value);
+  } else {
+    listsByKey.set(key, [value]);
+  }
 }
 
-// Helper function to check if text is an ignorable HTML entity
-function isIgnorableHtmlEntity(text: string): boolean {
-  // Ignore &nbsp;, &nbsp, and any other HTML entity if needed
-  return /^&nbsp;?$/i.test(text.trim());
+// Anything that can answer whether a translation key exists (a Set, or a view over several sets)
+interface KeyLookup {
+  has(key: string): boolean;
 }
 
 // Helper function to check if a key exists in translations, with optional prefix logic
-function keyExists(key: string, keySet: Set<string>, prefix?: string): boolean {
+function keyExists(key: string, keySet: KeyLookup, prefix?: string): boolean {
   // Always check the key as written
   if (keySet.has(key)) return true;
   // If a prefix is provided and the key starts with it, also check without the prefix
@@ -659,6 +589,6 @@ function keyExists(key: string, keySet: Set<string>, prefix?: string): boolean {
 }
 
 if (require.main === module) {
-  const exitCode = main();
-  process.exit(exitCode);
+  // Exit only once stdout has drained, so a large report piped to another process is not cut off
+  main().then((exitCode) => process.stdout.write('', () => process.exit(exitCode)));
 }
\ No newline at end of file